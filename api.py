@@ -2,24 +2,38 @@
 FastAPI Voice Cloning API
 High-quality multilingual voice cloning with XTTS v2
 """
-from fastapi import FastAPI, File, UploadFile, Form, BackgroundTasks, HTTPException
-from fastapi.responses import FileResponse, HTMLResponse, JSONResponse
+from fastapi import FastAPI, File, UploadFile, Form, HTTPException, Request, Depends
+from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.datastructures import Headers
 from pydantic import BaseModel
 from typing import Optional, Dict
+from contextlib import asynccontextmanager
 import uuid
 from pathlib import Path
-import shutil
 import asyncio
-from datetime import datetime
+import aiofiles
+import redis.asyncio as aioredis
+from arq import create_pool
+from arq.connections import ArqRedis, RedisSettings
+from collections import Counter, OrderedDict, deque
+from datetime import datetime, timezone
 import psutil
+import functools
+import json
+import orjson
+import os
+import tempfile
 import time
 
 # Import core TTS functionality
 from core import (
     clone_voice_sync,
+    cleanup_old_outputs,
     SUPPORTED_LANGUAGES,
+    AUDIO_EXTENSIONS,
+    MAX_TEXT_CHARS,
     OUTPUT_DIR,
     TEMP_DIR,
     get_system_info,
@@ -28,39 +42,222 @@ from core import (
     CODESPACE_NAME
 )
 
+# Redis job store (shared across uvicorn workers when REDIS_URL is set)
+REDIS_URL = os.getenv("REDIS_URL")
+REDIS_JOB_TTL_SECONDS = 86400  # Queued/processing Redis jobs expire after 24 hours
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", "50"))  # Shared pool size per process
+REDIS_POOL_TIMEOUT_SECONDS = 10  # Wait this long for a free pooled connection
+redis_client: Optional[aioredis.Redis] = None
+
+# Updates a job hash only if it still exists, in one round trip
+# (KEYS[1] = job key, ARGV = ttl, field1, value1, field2, value2, ...)
+UPDATE_JOB_LUA = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+redis.call('HSET', KEYS[1], unpack(ARGV, 2))
+redis.call('EXPIRE', KEYS[1], ARGV[1])
+return 1
+"""
+update_job_script = None
+
+# ARQ job queue (clone jobs run in separate `arq worker.WorkerSettings` processes)
+USE_ARQ_QUEUE = os.getenv("USE_ARQ_QUEUE") == "true"
+arq_pool: Optional[ArqRedis] = None
+
+# In-process job queue (used when USE_ARQ_QUEUE is not set)
+MAX_CONCURRENT_CLONES = max(1, int(os.getenv("MAX_CONCURRENT_CLONES", "1")))  # Concurrent XTTS inferences
+clone_slots = asyncio.Semaphore(MAX_CONCURRENT_CLONES)  # Shared by /api/clone and the queue workers
+MAX_QUEUED_JOBS = 100  # Reject new async jobs when this many are waiting
+job_queue: Optional[asyncio.Queue] = None
+
+async def connect_job_store():
+    """Connect to Redis if configured, otherwise keep jobs in memory"""
+    global redis_client, update_job_script
+    
+    if REDIS_URL:
+        # One bounded pool shared by all requests; callers wait for a free
+        # connection instead of opening unbounded new ones under load
+        pool = aioredis.BlockingConnectionPool.from_url(
+            REDIS_URL,
+            max_connections=REDIS_MAX_CONNECTIONS,
+            timeout=REDIS_POOL_TIMEOUT_SECONDS,
+            decode_responses=True
+        )
+        redis_client = aioredis.Redis.from_pool(pool)
+        await redis_client.ping()
+        update_job_script = redis_client.register_script(UPDATE_JOB_LUA)
+        print(f"🗄️ Job store: Redis ({REDIS_URL})")
+    else:
+        print("🗄️ Job store: in-memory (set REDIS_URL to share jobs across workers)")
+
+async def close_job_store():
+    """Close the Redis connection if one is open"""
+    global redis_client
+    
+    if redis_client is not None:
+        await redis_client.aclose()
+        redis_client = None
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open shared connections on startup and close them on shutdown"""
+    global arq_pool, job_queue
+    
+    await connect_job_store()
+    
+    cleanup_task = asyncio.create_task(cleanup_loop())
+    sampler_task = asyncio.create_task(resource_sampler())
+    
+    worker_tasks = []
+    if USE_ARQ_QUEUE:
+        if not REDIS_URL:
+            raise RuntimeError("USE_ARQ_QUEUE requires REDIS_URL to be set")
+        arq_pool = await create_pool(RedisSettings.from_dsn(REDIS_URL))
+        print("📬 Clone jobs: ARQ worker queue")
+    else:
+        job_queue = asyncio.Queue(maxsize=MAX_QUEUED_JOBS)
+        worker_tasks = [asyncio.create_task(clone_worker()) for _ in range(MAX_CONCURRENT_CLONES)]
+        print(f"📬 Clone jobs: in-process queue ({MAX_CONCURRENT_CLONES} worker(s))")
+    
+    yield
+    
+    background_tasks = [cleanup_task, sampler_task, *worker_tasks]
+    for task in background_tasks:
+        task.cancel()
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+    job_queue = None
+    
+    if arq_pool is not None:
+        await arq_pool.aclose()
+        arq_pool = None
+    await close_job_store()
+
+class OrjsonResponse(JSONResponse):
+    """JSON response serialized with orjson (C extension, several times faster than json.dumps)
+    
+    Returning one directly also skips FastAPI's jsonable_encoder pass, which is
+    worthwhile for the endpoints the UI polls (content must be plain JSON types).
+    """
+    
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
 # --- FastAPI App ---
 app = FastAPI(
     title="XTTS Voice Cloning API",
     description="High-quality multilingual voice cloning powered by Coqui XTTS v2",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=OrjsonResponse,
+    lifespan=lifespan
 )
 
+# Upload size limit (registered before CORS so 413 responses still carry CORS headers)
+class UploadSizeLimitMiddleware:
+    """Reject oversized clone uploads from Content-Length before the body is read
+    
+    Chunked uploads without a Content-Length would be spooled in full while
+    the form is parsed, so they are refused outright (browsers always send one).
+    Plain ASGI: every other request passes straight through, with none of the
+    per-request task and stream overhead of an @app.middleware("http") function.
+    """
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["method"] == "POST" and scope["path"].startswith("/api/clone"):
+            content_length = Headers(scope=scope).get("content-length", "")
+            response = None
+            if not content_length.isdigit():
+                response = OrjsonResponse(
+                    status_code=411,
+                    content={"detail": "Content-Length header required for uploads."}
+                )
+            elif int(content_length) > MAX_UPLOAD_BYTES:
+                response = OrjsonResponse(
+                    status_code=413,
+                    content={"detail": "Audio file too large. Maximum 10MB allowed."}
+                )
+            if response is not None:
+                await response(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
+
+
+app.add_middleware(UploadSizeLimitMiddleware)
+
 # Enable CORS for frontend access - restricted to trusted origins
+# (override with a comma-separated CORS_ORIGINS list)
+DEFAULT_CORS_ORIGINS = [
+    "https://yassineai01-lyrebird.hf.space",
+    "https://yass5002.github.io",
+    "http://localhost:8000",
+    "http://127.0.0.1:8000"
+]
+CORS_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv("CORS_ORIGINS", "").split(",")
+    if origin.strip()
+] or DEFAULT_CORS_ORIGINS
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
-        "https://yassineai01-lyrebird.hf.space",
-        "https://yass5002.github.io",
-        "http://localhost:8000",
-        "http://127.0.0.1:8000"
-    ],
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
+    allow_methods=["GET", "POST", "DELETE"],
     allow_headers=["*"],
+    max_age=86400,  # Let browsers cache preflight responses for a day
 )
 
-# Job storage (use Redis in production for scalability)
+# In-memory job storage (used when REDIS_URL is not set)
 jobs: Dict[str, dict] = {}
+MAX_RECENT_JOB_IDS = 10_000  # Job IDs kept for /api/jobs listings
+recent_job_ids: deque = deque(maxlen=MAX_RECENT_JOB_IDS)  # Oldest first
+finished_jobs: OrderedDict = OrderedDict()  # job_id -> time.monotonic() at completion, oldest first
+status_counts: Counter = Counter()  # Number of jobs per status
 
 # Job cleanup configuration
 MAX_JOBS_IN_MEMORY = 100  # Maximum number of jobs to keep
-JOB_TTL_SECONDS = 3600  # Jobs expire after 1 hour
+JOB_TTL_SECONDS = 3600  # Jobs (and generated audio) expire after 1 hour
+CLEANUP_INTERVAL_SECONDS = 900  # Run the periodic cleanup every 15 minutes
+TEMP_FILE_MAX_AGE_HOURS = 2  # Leftover uploads older than this are removed
+
+# Upload streaming configuration
+UPLOAD_CHUNK_SIZE = 1 << 20  # Write uploads to disk in 1MB chunks
+MAX_AUDIO_BYTES = 10 * 1024 * 1024  # 10MB reference audio limit
+UNSUPPORTED_LANGUAGE_DETAIL = f"Unsupported language. Use one of: {', '.join(SUPPORTED_LANGUAGES)}"
+UNSUPPORTED_FORMAT_DETAIL = "Unsupported audio format. Use: WAV, MP3, FLAC, OGG, or M4A"
+MAX_UPLOAD_BYTES = MAX_AUDIO_BYTES + 64 * 1024  # Audio plus form fields and multipart overhead
+
+# Generated audio lookup (filename -> path), filled as clones complete
+audio_index: Dict[str, Path] = {}
+AUDIO_CACHE_CONTROL = "public, max-age=3600"  # Generated files never change once written
 
 # Track server start time
 SERVER_START_TIME = time.time()
 
+# Timestamps only carry whole seconds, so each second is formatted once
+iso_cache = {"second": 0, "iso": ""}
+
+def iso_now() -> str:
+    """Current UTC time as an ISO-8601 string (e.g. 2025-01-31T12:00:00Z)"""
+    second = int(time.time())
+    if second != iso_cache["second"]:
+        iso_cache["iso"] = datetime.fromtimestamp(second, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        iso_cache["second"] = second
+    return iso_cache["iso"]
+
+# System probe configuration
+CPU_COUNT = psutil.cpu_count()  # Fixed for the lifetime of the process
+RESOURCE_SAMPLE_INTERVAL_SECONDS = 1.0  # How often the background sampler refreshes CPU/RAM
+resource_snapshot = {"cpu_percent": 0.0, "memory": None}  # Latest sampler readings
+
+# Prime psutil's CPU counters so later non-blocking calls measure a real interval
+psutil.cpu_percent(interval=None)
+
 def get_container_cpu_percent():
     """Get CPU usage for the container (Docker/cgroup aware)"""
     try:
@@ -82,9 +279,28 @@ def get_container_cpu_percent():
             pass
         
         # Fallback to psutil (works but shows host metrics)
-        return psutil.cpu_percent(interval=0.1)
+        # interval=None is non-blocking: usage since the previous call
+        return psutil.cpu_percent(interval=None)
     except Exception:
-        return psutil.cpu_percent(interval=0.1)
+        return psutil.cpu_percent(interval=None)
+
+def probe_system_resources() -> tuple[float, dict]:
+    """Read CPU and memory usage (blocking file reads)"""
+    return get_container_cpu_percent(), get_container_memory()
+
+async def resource_sampler():
+    """Refresh resource_snapshot every RESOURCE_SAMPLE_INTERVAL_SECONDS
+    
+    One probe serves every /api/resources poller, however many there are.
+    """
+    while True:
+        try:
+            cpu_percent, memory = await asyncio.to_thread(probe_system_resources)
+            resource_snapshot["cpu_percent"] = cpu_percent
+            resource_snapshot["memory"] = memory
+        except Exception as e:
+            print(f"⚠️ Resource sampling failed: {e}")
+        await asyncio.sleep(RESOURCE_SAMPLE_INTERVAL_SECONDS)
 
 def get_container_memory():
     """Get memory usage for the container (Docker/cgroup aware)"""
@@ -153,41 +369,323 @@ def get_container_memory():
             "percent": round(memory.percent, 1)
         }
 
-def cleanup_old_jobs():
-    """Remove old completed/failed jobs to prevent memory leaks"""
-    global jobs
-    
-    current_time = time.time()
-    jobs_to_remove = []
-    
-    # Find expired jobs
-    for job_id, job_data in jobs.items():
-        if job_data.get('status') in ['completed', 'failed']:
-            completed_at = job_data.get('completed_at')
-            if completed_at:
-                try:
-                    completed_time = datetime.fromisoformat(completed_at).timestamp()
-                    if current_time - completed_time > JOB_TTL_SECONDS:
-                        jobs_to_remove.append(job_id)
-                except Exception:
-                    pass
+# --- Job Store ---
+RECENT_JOBS_KEY = "jobs:recent"  # Redis list of job IDs, newest first
+
+def _job_key(job_id: str) -> str:
+    return f"job:{job_id}"
+
+def _decode_job(data: dict) -> dict:
+    """Decode a Redis job hash (values are stored JSON-encoded)"""
+    return {k: json.loads(v) for k, v in data.items()}
+
+def _pop_memory_job(job_id: str) -> Optional[dict]:
+    """Remove a job from the in-memory store, keeping its indexes in sync"""
+    job_data = jobs.pop(job_id, None)
+    if job_data is not None:
+        status_counts[job_data.get('status')] -= 1
+    finished_jobs.pop(job_id, None)
+    
+    # Jobs mostly leave in creation order, so dropping dead IDs from the front keeps
+    # recent_job_ids close to len(jobs) and list_jobs from walking removed jobs
+    while recent_job_ids and recent_job_ids[0] not in jobs:
+        recent_job_ids.popleft()
+    return job_data
+
+async def create_job(job_id: str, data: dict):
+    """Store a new job record"""
+    if redis_client is None:
+        jobs[job_id] = data
+        recent_job_ids.append(job_id)
+        status_counts[data.get('status')] += 1
+        await cleanup_expired_jobs()
+        return
+    
+    key = _job_key(job_id)
+    async with redis_client.pipeline(transaction=True) as pipe:
+        pipe.hset(key, mapping={k: json.dumps(v) for k, v in data.items()})
+        pipe.expire(key, REDIS_JOB_TTL_SECONDS)
+        pipe.lpush(RECENT_JOBS_KEY, job_id)
+        pipe.ltrim(RECENT_JOBS_KEY, 0, MAX_RECENT_JOB_IDS - 1)
+        await pipe.execute()
+
+async def update_job(job_id: str, fields: dict):
+    """Update fields of an existing job (no-op if the job was deleted)"""
+    finished = fields.get('status') in ['completed', 'failed']
+    
+    if redis_client is None:
+        job = jobs.get(job_id)
+        if job is not None:
+            old_status = job.get('status')
+            job.update(fields)
+            if job.get('status') != old_status:
+                status_counts[old_status] -= 1
+                status_counts[job.get('status')] += 1
+            if finished:
+                finished_jobs[job_id] = time.monotonic()
+        return
+    
+    # Finished jobs follow the same JOB_TTL_SECONDS retention as the in-memory store
+    args = [JOB_TTL_SECONDS if finished else REDIS_JOB_TTL_SECONDS]
+    for k, v in fields.items():
+        args += (k, json.dumps(v))
+    await update_job_script(keys=[_job_key(job_id)], args=args)
+
+async def get_job(job_id: str) -> Optional[dict]:
+    """Get a job record, or None if it does not exist"""
+    if redis_client is None:
+        return jobs.get(job_id)
+    
+    data = await redis_client.hgetall(_job_key(job_id))
+    return _decode_job(data) if data else None
+
+async def get_recent_jobs(limit: int) -> list[tuple[str, dict]]:
+    """Get up to `limit` of the most recent jobs, oldest first
+    
+    Reads the recent-ID list newest first, only as far as needed; IDs of
+    deleted or expired jobs are skipped and pruned from the list.
+    """
+    if limit <= 0:
+        return []
+    
+    if redis_client is None:
+        recent = []
+        for job_id in reversed(recent_job_ids):
+            job_data = jobs.get(job_id)
+            if job_data is not None:
+                recent.append((job_id, job_data))
+                if len(recent) == limit:
+                    break
+        recent.reverse()
+        return recent
+    
+    # Finished jobs expire sooner than queued ones, so expired IDs can sit anywhere
+    # in the list: keep reading past them until `limit` live jobs are found, and
+    # drop them from the list so later reads do not pay for them again
+    recent = []
+    dead_ids = []
+    start = 0
+    while len(recent) < limit:
+        job_ids = await redis_client.lrange(RECENT_JOBS_KEY, start, start + limit - 1)
+        if not job_ids:
+            break
+        start += len(job_ids)
+        
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for job_id in job_ids:
+                pipe.hgetall(_job_key(job_id))
+            results = await pipe.execute()
+        
+        for job_id, data in zip(job_ids, results):
+            if not data:
+                dead_ids.append(job_id)
+            elif len(recent) < limit:
+                recent.append((job_id, _decode_job(data)))
+    
+    if dead_ids:
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for job_id in dead_ids:
+                pipe.lrem(RECENT_JOBS_KEY, 1, job_id)
+            await pipe.execute()
+    
+    recent.reverse()
+    return recent
+
+async def count_jobs() -> int:
+    """Count stored job records"""
+    if redis_client is None:
+        return len(jobs)
+    
+    return len([key async for key in redis_client.scan_iter(match=_job_key("*"))])
+
+async def get_status_counts() -> Counter:
+    """Count stored jobs by status
+    
+    The in-memory store keeps these counts up to date on every transition;
+    Redis keys expire silently, so there the status fields are read back.
+    """
+    if redis_client is None:
+        return status_counts
+    
+    keys = [key async for key in redis_client.scan_iter(match=_job_key("*"))]
+    async with redis_client.pipeline(transaction=False) as pipe:
+        for key in keys:
+            pipe.hget(key, "status")
+        results = await pipe.execute()
+    return Counter(json.loads(status) for status in results if status is not None)
+
+async def delete_job_record(job_id: str):
+    """Remove a job record"""
+    if redis_client is None:
+        _pop_memory_job(job_id)
+        return
+    
+    async with redis_client.pipeline(transaction=True) as pipe:
+        pipe.delete(_job_key(job_id))
+        pipe.lrem(RECENT_JOBS_KEY, 1, job_id)
+        await pipe.execute()
+
+# --- Uploads ---
+def reserve_file_space(fd: int, size: int):
+    """Allocate a file's blocks up front so it is written contiguously (Linux only)"""
+    if hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(fd, 0, size)
+        except OSError:
+            # Not supported by every filesystem; the write simply proceeds without it
+            pass
+
+async def save_upload(audio: UploadFile, destination: Path) -> int:
+    """Stream an uploaded file to disk, aborting if it exceeds MAX_AUDIO_BYTES
+    
+    The size is checked while streaming, so the upload is never read twice.
+    When Starlette already knows the size of the spooled upload, oversized
+    files are rejected before anything is written.
+    """
+    if audio.size is not None and audio.size > MAX_AUDIO_BYTES:
+        written = audio.size
+    else:
+        written = 0
+        async with aiofiles.open(destination, "wb") as f:
+            if audio.size:
+                await asyncio.to_thread(reserve_file_space, f.fileno(), audio.size)
+            while chunk := await audio.read(UPLOAD_CHUNK_SIZE):
+                written += len(chunk)
+                if written > MAX_AUDIO_BYTES:
+                    break
+                await f.write(chunk)
+    
+    if written > MAX_AUDIO_BYTES:
+        destination.unlink(missing_ok=True)
+        raise HTTPException(
+            status_code=413,
+            detail="Audio file too large. Maximum 10MB allowed."
+        )
+    
+    if written == 0:
+        destination.unlink(missing_ok=True)
+        raise HTTPException(
+            status_code=400,
+            detail="Audio file is empty."
+        )
+    return written
+
+# --- Audio Index ---
+def index_audio_file(result_path: str) -> str:
+    """Record a generated file in the audio index and return its filename"""
+    path = Path(result_path)
+    audio_index[path.name] = path
+    return path.name
+
+def find_indexed_audio(filename: str) -> Optional[tuple[Path, os.stat_result]]:
+    """Look up a generated audio file in the index (one dict lookup and one stat)"""
+    path = audio_index.get(filename)
+    if path is None:
+        return None
+    try:
+        return path, path.stat()
+    except OSError:
+        audio_index.pop(filename, None)
+        return None
+
+def scan_for_audio(filename: str) -> Optional[tuple[Path, os.stat_result]]:
+    """Search OUTPUT_DIR and its subdirectories, indexing the file if found"""
+    # Generated files are always .wav; anything else cannot exist here
+    if Path(filename).name != filename or not filename.endswith(".wav"):
+        return None
+    
+    # Fallback (unorganized) outputs live directly in OUTPUT_DIR: a single stat
+    path = OUTPUT_DIR / filename
+    if path.is_file():
+        audio_index[filename] = path
+        return path, path.stat()
+    
+    for path in OUTPUT_DIR.rglob(filename):
+        if path.is_file():
+            audio_index[filename] = path
+            return path, path.stat()
+    return None
+
+def cleanup_old_jobs() -> list[dict]:
+    """Remove old completed/failed jobs to prevent memory leaks
+    
+    Finished jobs are tracked in completion order, so only the jobs being
+    removed are visited. Only the in-memory store needs this; Redis records
+    expire on their own. Returns the expired jobs whose audio should be deleted.
+    """
+    expire_before = time.monotonic() - JOB_TTL_SECONDS
+    expired = []
     
     # Remove expired jobs
-    for job_id in jobs_to_remove:
-        del jobs[job_id]
+    while finished_jobs:
+        job_id, finished_at = next(iter(finished_jobs.items()))
+        if finished_at > expire_before:
+            break
+        job_data = _pop_memory_job(job_id)
+        if job_data is not None:
+            expired.append(job_data)
     
     # If still too many jobs, remove oldest completed/failed ones
-    if len(jobs) > MAX_JOBS_IN_MEMORY:
-        completed_jobs = [
-            (jid, jdata.get('completed_at', ''))
-            for jid, jdata in jobs.items()
-            if jdata.get('status') in ['completed', 'failed']
-        ]
-        completed_jobs.sort(key=lambda x: x[1])
-        
-        excess = len(jobs) - MAX_JOBS_IN_MEMORY
-        for job_id, _ in completed_jobs[:excess]:
-            del jobs[job_id]
+    while len(jobs) > MAX_JOBS_IN_MEMORY and finished_jobs:
+        _pop_memory_job(next(iter(finished_jobs)))
+    
+    return expired
+
+async def cleanup_expired_jobs():
+    """Remove old jobs, deleting their generated audio on a worker thread"""
+    for job_data in cleanup_old_jobs():
+        await asyncio.to_thread(delete_job_audio, job_data)
+
+def delete_job_audio(job_data: dict):
+    """Delete the generated audio file of a job, if any"""
+    if job_data.get('audio_url'):
+        try:
+            filename = job_data['audio_url'].split('/')[-1]
+            audio_file = audio_index.pop(filename, OUTPUT_DIR / filename)
+            if audio_file.exists():
+                audio_file.unlink()
+        except Exception:
+            pass
+
+def sweep_old_outputs(max_age_seconds: float) -> list[str]:
+    """Delete generated WAVs older than max_age_seconds anywhere under OUTPUT_DIR
+    
+    Catches the audio no job expiry removes: synchronous /api/clone results,
+    jobs whose Redis records expired, and jobs evicted for capacity.
+    Returns the names of the removed files.
+    """
+    cutoff = time.time() - max_age_seconds
+    removed = []
+    for dirpath, _, filenames in os.walk(OUTPUT_DIR):
+        for name in filenames:
+            if not name.endswith(".wav"):
+                continue
+            path = os.path.join(dirpath, name)
+            try:
+                if os.stat(path).st_mtime < cutoff:
+                    os.unlink(path)
+                    removed.append(name)
+            except OSError:
+                pass
+    return removed
+
+async def cleanup_loop():
+    """Periodically expire old jobs and sweep old outputs and leftover temp uploads
+    
+    The first sweep runs at startup to reclaim uploads orphaned by a crash.
+    """
+    while True:
+        try:
+            await cleanup_expired_jobs()
+            for filename in await asyncio.to_thread(sweep_old_outputs, JOB_TTL_SECONDS):
+                audio_index.pop(filename, None)
+            await asyncio.to_thread(
+                cleanup_old_outputs, TEMP_DIR,
+                max_age_hours=TEMP_FILE_MAX_AGE_HOURS, pattern="*.*"
+            )
+        except Exception as e:
+            print(f"⚠️ Periodic cleanup failed: {e}")
+        await asyncio.sleep(CLEANUP_INTERVAL_SECONDS)
 
 # --- Models ---
 class CloneRequest(BaseModel):
@@ -203,15 +701,7 @@ class JobStatus(BaseModel):
     error: Optional[str] = None
 
 # --- Root Endpoint ---
-@app.get("/", response_class=HTMLResponse)
-async def root():
-    """Serve the main HTML interface"""
-    html_file = Path("static/index.html")
-    if html_file.exists():
-        return html_file.read_text()
-    
-    # Fallback if static files not set up
-    return """
+FALLBACK_HTML = """
     <html>
         <head><title>XTTS Voice Cloning API</title></head>
         <body>
@@ -226,6 +716,15 @@ async def root():
     </html>
     """
 
+# Read the main HTML interface once at startup (fallback if static files not set up)
+html_file = Path("static/index.html")
+INDEX_HTML = html_file.read_text() if html_file.exists() else FALLBACK_HTML
+
+@app.get("/", response_class=HTMLResponse)
+async def root():
+    """Serve the main HTML interface"""
+    return HTMLResponse(INDEX_HTML)
+
 # --- Health Check ---
 @app.get("/api/health")
 async def health_check():
@@ -233,12 +732,13 @@ async def health_check():
     info = get_system_info()
     
     # Add job stats
-    active_jobs = len([j for j in jobs.values() if j.get('status') in ['queued', 'processing']])
-    total_jobs = len(jobs)
+    counts = await get_status_counts()
+    active_jobs = counts['queued'] + counts['processing']
+    total_jobs = sum(counts.values())
     
     return {
         "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": iso_now(),
         "jobs": {
             "active": active_jobs,
             "total_in_memory": total_jobs,
@@ -252,22 +752,21 @@ async def health_check():
 async def get_resources():
     """Get real-time system resource usage (container-aware)"""
     try:
-        # CPU usage (container-aware)
-        cpu_percent = get_container_cpu_percent()
-        
-        # RAM usage (container-aware)
-        memory_info = get_container_memory()
+        # CPU and RAM usage (container-aware, sampled in the background)
+        cpu_percent = resource_snapshot["cpu_percent"]
+        memory_info = resource_snapshot["memory"] or get_container_memory()
         
         # Queue count
-        queue_count = len([j for j in jobs.values() if j.get('status') in ['queued', 'processing']])
+        counts = await get_status_counts()
+        queue_count = counts['queued'] + counts['processing']
         
         # Uptime
         uptime_seconds = int(time.time() - SERVER_START_TIME)
         
-        return {
+        return OrjsonResponse({
             "cpu": {
                 "percent": round(cpu_percent, 1),
-                "cores": psutil.cpu_count()
+                "cores": CPU_COUNT
             },
             "ram": {
                 "percent": memory_info["percent"],
@@ -277,60 +776,61 @@ async def get_resources():
             "queue": {
                 "count": queue_count,
                 "jobs": {
-                    "queued": len([j for j in jobs.values() if j.get('status') == 'queued']),
-                    "processing": len([j for j in jobs.values() if j.get('status') == 'processing']),
-                    "completed": len([j for j in jobs.values() if j.get('status') == 'completed']),
-                    "failed": len([j for j in jobs.values() if j.get('status') == 'failed'])
+                    "queued": counts['queued'],
+                    "processing": counts['processing'],
+                    "completed": counts['completed'],
+                    "failed": counts['failed']
                 }
             },
             "uptime": {
                 "seconds": uptime_seconds,
                 "formatted": f"{uptime_seconds // 3600}h {(uptime_seconds % 3600) // 60}m"
             },
-            "timestamp": datetime.now().isoformat()
-        }
+            "timestamp": iso_now()
+        })
     except Exception as e:
-        return {
+        return OrjsonResponse({
             "error": str(e),
             "cpu": {"percent": 0},
             "ram": {"percent": 0},
             "queue": {"count": 0},
             "uptime": {"seconds": 0}
-        }
+        })
 
 # --- Language List ---
+# Supported languages are fixed at import, so encode the response body once
+LANGUAGES_BODY = orjson.dumps({
+    "languages": list(SUPPORTED_LANGUAGES.keys()),
+    "total": len(SUPPORTED_LANGUAGES)
+})
+
 @app.get("/api/languages")
 async def get_languages():
     """Get list of supported languages"""
-    return {
-        "languages": list(SUPPORTED_LANGUAGES.keys()),
-        "total": len(SUPPORTED_LANGUAGES)
-    }
+    return Response(
+        LANGUAGES_BODY,
+        media_type="application/json",
+        headers={"Cache-Control": "public, max-age=3600"}
+    )
 
-# --- Synchronous Voice Cloning ---
-@app.post("/api/clone")
-async def clone_voice_api(
-    text: str = Form(..., description="Text to synthesize (max 2000 characters)"),
+# --- Input Validation ---
+async def validate_clone_inputs(
+    text: str = Form(..., description=f"Text to synthesize (max {MAX_TEXT_CHARS} characters)"),
     audio: UploadFile = File(..., description="Reference audio file (WAV, MP3, FLAC, OGG, M4A)"),
     language: str = Form("English", description="Output language")
-):
-    """
-    Synchronous voice cloning endpoint.
+) -> tuple[str, UploadFile, str, str]:
+    """Validate the form fields shared by both clone endpoints
     
-    Upload a reference audio file and text, returns the generated audio file.
-    This endpoint waits for processing to complete before responding.
+    The audio size is checked later, while save_upload streams it to disk.
     
-    For long texts or to avoid timeouts, use /api/clone/async instead.
+    Returns:
+        tuple: (text, audio, language, file_ext)
     """
-    
-    # Cleanup old jobs periodically
-    cleanup_old_jobs()
-    
     # Validate text length
-    if len(text) > 2000:
+    if len(text) > MAX_TEXT_CHARS:
         raise HTTPException(
             status_code=400,
-            detail="Text too long. Maximum 2000 characters allowed."
+            detail=f"Text too long. Maximum {MAX_TEXT_CHARS} characters allowed."
         )
     
     if len(text.strip()) == 0:
@@ -343,7 +843,7 @@ async def clone_voice_api(
     if language not in SUPPORTED_LANGUAGES:
         raise HTTPException(
             status_code=400,
-            detail=f"Unsupported language. Use one of: {', '.join(SUPPORTED_LANGUAGES.keys())}"
+            detail=UNSUPPORTED_LANGUAGE_DETAIL
         )
     
     # Validate file type
@@ -351,50 +851,60 @@ async def clone_voice_api(
         raise HTTPException(status_code=400, detail="No filename provided")
     
     file_ext = audio.filename.split('.')[-1].lower()
-    if file_ext not in ['wav', 'mp3', 'flac', 'ogg', 'm4a']:
+    if file_ext not in AUDIO_EXTENSIONS:
         raise HTTPException(
             status_code=400,
-            detail="Unsupported audio format. Use: WAV, MP3, FLAC, OGG, or M4A"
+            detail=UNSUPPORTED_FORMAT_DETAIL
         )
     
-    # Validate file size (max 10MB)
-    audio.file.seek(0, 2)  # Seek to end
-    file_size = audio.file.tell()
-    audio.file.seek(0)  # Reset to beginning
+    return text, audio, language, file_ext
+
+# --- Synchronous Voice Cloning ---
+@app.post("/api/clone")
+async def clone_voice_api(
+    clone_inputs: tuple[str, UploadFile, str, str] = Depends(validate_clone_inputs)
+):
+    """
+    Synchronous voice cloning endpoint.
     
-    if file_size > 10 * 1024 * 1024:  # 10MB
-        raise HTTPException(
-            status_code=400,
-            detail="Audio file too large. Maximum 10MB allowed."
-        )
+    Upload a reference audio file and text, returns the generated audio file.
+    This endpoint waits for processing to complete before responding.
     
-    if file_size == 0:
-        raise HTTPException(
-            status_code=400,
-            detail="Audio file is empty."
-        )
+    For long texts or to avoid timeouts, use /api/clone/async instead.
+    """
+    text, audio, language, file_ext = clone_inputs
     
     # Save uploaded audio to temp file
-    temp_audio = TEMP_DIR / f"{uuid.uuid4().hex}.{file_ext}"
+    # NamedTemporaryFile creates the name atomically (O_EXCL), so it never clobbers
+    # a file left behind by a crashed process; the cleanup loop sweeps those. This
+    # replaces pid + counter names: those skipped an open/close, but a recycled pid
+    # after a crash could reuse a leftover file's name
+    with tempfile.NamedTemporaryFile(
+        dir=TEMP_DIR, prefix="upload_", suffix=f".{file_ext}", delete=False
+    ) as tf:
+        temp_audio = Path(tf.name)
     
     try:
-        with temp_audio.open("wb") as f:
-            shutil.copyfileobj(audio.file, f)
+        await save_upload(audio, temp_audio)
         
-        # Process voice cloning
-        result_path, status = clone_voice_sync(text, str(temp_audio), language)
+        # Process voice cloning on a worker thread so the event loop stays responsive,
+        # sharing the inference slots with queued jobs
+        async with clone_slots:
+            result_path, status = await asyncio.to_thread(
+                clone_voice_sync, text, str(temp_audio), language
+            )
         
         if result_path and Path(result_path).exists():
             # Get filename for URL
-            filename = Path(result_path).name
+            filename = index_audio_file(result_path)
             
-            return JSONResponse({
+            return {
                 "success": True,
                 "audio_url": f"/api/audio/{filename}",
                 "message": status,
                 "language": language,
                 "text_length": len(text)
-            })
+            }
         else:
             raise HTTPException(status_code=500, detail=status)
             
@@ -410,10 +920,7 @@ async def clone_voice_api(
 # --- Asynchronous Voice Cloning ---
 @app.post("/api/clone/async")
 async def clone_voice_async(
-    background_tasks: BackgroundTasks,
-    text: str = Form(..., description="Text to synthesize (max 2000 characters)"),
-    audio: UploadFile = File(..., description="Reference audio file"),
-    language: str = Form("English", description="Output language")
+    clone_inputs: tuple[str, UploadFile, str, str] = Depends(validate_clone_inputs)
 ):
     """
     Asynchronous voice cloning endpoint.
@@ -423,56 +930,13 @@ async def clone_voice_async(
     
     Recommended for longer texts or to avoid HTTP timeouts.
     """
+    text, audio, language, file_ext = clone_inputs
     
-    # Cleanup old jobs periodically
-    cleanup_old_jobs()
-    
-    # Validate text length
-    if len(text) > 2000:
-        raise HTTPException(
-            status_code=400,
-            detail="Text too long. Maximum 2000 characters allowed."
-        )
-    
-    if len(text.strip()) == 0:
-        raise HTTPException(
-            status_code=400,
-            detail="Text cannot be empty."
-        )
-    
-    # Validate language
-    if language not in SUPPORTED_LANGUAGES:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Unsupported language. Use one of: {', '.join(SUPPORTED_LANGUAGES.keys())}"
-        )
-    
-    # Validate file type
-    if not audio.filename:
-        raise HTTPException(status_code=400, detail="No filename provided")
-    
-    file_ext = audio.filename.split('.')[-1].lower()
-    if file_ext not in ['wav', 'mp3', 'flac', 'ogg', 'm4a']:
-        raise HTTPException(
-            status_code=400,
-            detail="Unsupported audio format. Use: WAV, MP3, FLAC, OGG, or M4A"
-        )
-    
-    # Validate file size (max 10MB)
-    audio.file.seek(0, 2)  # Seek to end
-    file_size = audio.file.tell()
-    audio.file.seek(0)  # Reset to beginning
-    
-    if file_size > 10 * 1024 * 1024:  # 10MB
-        raise HTTPException(
-            status_code=400,
-            detail="Audio file too large. Maximum 10MB allowed."
-        )
-    
-    if file_size == 0:
+    # Fast path: refuse before storing the upload (put_nowait() below is the real check)
+    if job_queue is not None and job_queue.full():
         raise HTTPException(
-            status_code=400,
-            detail="Audio file is empty."
+            status_code=503,
+            detail="Too many jobs in queue. Please try again later."
         )
     
     # Generate job ID
@@ -480,26 +944,43 @@ async def clone_voice_async(
     
     # Save uploaded audio
     temp_audio = TEMP_DIR / f"{job_id}.{file_ext}"
-    with temp_audio.open("wb") as f:
-        shutil.copyfileobj(audio.file, f)
+    await save_upload(audio, temp_audio)
     
     # Initialize job status
-    jobs[job_id] = {
+    await create_job(job_id, {
         "status": "queued",
         "progress": 0.0,
         "message": "Job queued for processing...",
         "audio_url": None,
         "error": None,
-        "created_at": datetime.now().isoformat(),
+        "created_at": iso_now(),
         "language": language,
         "text_length": len(text)
-    }
+    })
     
-    # Process in background
-    background_tasks.add_task(
-        process_clone_background,
-        job_id, text, str(temp_audio), language
-    )
+    # Process in dedicated ARQ workers if enabled, otherwise in this process
+    if arq_pool is not None:
+        await arq_pool.enqueue_job(
+            "process_clone",
+            job_id, text, str(temp_audio), language,
+            _job_id=job_id
+        )
+    else:
+        try:
+            job_queue.put_nowait({
+                "job_id": job_id,
+                "text": text,
+                "audio_path": str(temp_audio),
+                "language": language
+            })
+        except asyncio.QueueFull:
+            # Concurrent submissions can all pass the early check while saving uploads
+            await delete_job_record(job_id)
+            await asyncio.to_thread(temp_audio.unlink, missing_ok=True)
+            raise HTTPException(
+                status_code=503,
+                detail="Too many jobs in queue. Please try again later."
+            )
     
     return {
         "job_id": job_id,
@@ -509,57 +990,93 @@ async def clone_voice_async(
     }
 
 # --- Background Processing ---
-def process_clone_background(job_id: str, text: str, audio_path: str, language: str):
+async def process_clone_background(job_id: str, text: str, audio_path: str, language: str):
     """Process voice cloning in background task"""
+    loop = asyncio.get_running_loop()
+    cancelled = False
     
     def update_progress(progress: float, message: str):
-        """Update job progress"""
-        if job_id in jobs:
-            jobs[job_id]["progress"] = progress
-            jobs[job_id]["message"] = message
-            if progress > 0.1:
-                jobs[job_id]["status"] = "processing"
+        """Update job progress (called from the inference thread)"""
+        if cancelled:
+            return  # The job has already been marked failed
+        fields = {"progress": progress, "message": message}
+        if progress > 0.1:
+            fields["status"] = "processing"
+        # Wait for the write so progress updates stay ordered with the final status
+        asyncio.run_coroutine_threadsafe(update_job(job_id, fields), loop).result()
+    
+    async def mark_cancelled():
+        """Fail the job so clients stop polling it"""
+        await update_job(job_id, {
+            "status": "failed",
+            "progress": 0.0,
+            "error": "Job was cancelled or timed out",
+            "message": "Processing cancelled",
+            "completed_at": iso_now()
+        })
     
     try:
-        jobs[job_id]["status"] = "processing"
-        jobs[job_id]["message"] = "Starting voice cloning..."
+        if clone_slots.locked():
+            await update_job(job_id, {
+                "status": "queued",
+                "message": "Waiting for a free worker..."
+            })
         
-        # Process with progress callback
-        result_path, status = clone_voice_sync(
-            text, audio_path, language,
-            progress_callback=update_progress
-        )
+        async with clone_slots:
+            await update_job(job_id, {
+                "status": "processing",
+                "message": "Starting voice cloning..."
+            })
+            
+            # Process with progress callback on a worker thread
+            inference = asyncio.ensure_future(asyncio.to_thread(
+                clone_voice_sync, text, audio_path, language,
+                progress_callback=update_progress
+            ))
+            try:
+                result_path, status = await asyncio.shield(inference)
+            except asyncio.CancelledError:
+                # e.g. ARQ's job_timeout. The inference thread cannot be interrupted, so
+                # keep holding the slot (and the reference audio) until it returns;
+                # otherwise the next job would run a second inference alongside it
+                cancelled = True
+                await mark_cancelled()
+                await asyncio.wait([inference])
+                raise
         
         if result_path and Path(result_path).exists():
-            filename = Path(result_path).name
+            filename = index_audio_file(result_path)
             
-            jobs[job_id] = {
-                **jobs[job_id],
+            await update_job(job_id, {
                 "status": "completed",
                 "progress": 1.0,
                 "audio_url": f"/api/audio/{filename}",
                 "message": status,
-                "completed_at": datetime.now().isoformat()
-            }
+                "completed_at": iso_now()
+            })
         else:
-            jobs[job_id] = {
-                **jobs[job_id],
+            await update_job(job_id, {
                 "status": "failed",
                 "progress": 0.0,
                 "error": status,
                 "message": "Voice cloning failed",
-                "completed_at": datetime.now().isoformat()
-            }
-            
+                "completed_at": iso_now()
+            })
+    
+    except asyncio.CancelledError:
+        # CancelledError is not an Exception; without this the job would stay "processing"
+        if not cancelled:
+            cancelled = True
+            await mark_cancelled()
+        raise
     except Exception as e:
-        jobs[job_id] = {
-            **jobs[job_id],
+        await update_job(job_id, {
             "status": "failed",
             "progress": 0.0,
             "error": str(e),
             "message": "Processing error occurred",
-            "completed_at": datetime.now().isoformat()
-        }
+            "completed_at": iso_now()
+        })
     finally:
         # Cleanup temp audio file
         try:
@@ -567,14 +1084,24 @@ def process_clone_background(job_id: str, text: str, audio_path: str, language:
         except Exception:
             pass
 
+async def clone_worker():
+    """Consume queued jobs one at a time (MAX_CONCURRENT_CLONES of these run concurrently)"""
+    while True:
+        item = await job_queue.get()
+        try:
+            await process_clone_background(**item)
+        finally:
+            job_queue.task_done()
+
 # --- Job Status ---
 @app.get("/api/jobs/{job_id}")
 async def get_job_status(job_id: str):
     """Get status of an async job"""
-    if job_id not in jobs:
+    job_data = await get_job(job_id)
+    if job_data is None:
         raise HTTPException(status_code=404, detail="Job not found")
     
-    return jobs[job_id]
+    return OrjsonResponse(job_data)
 
 # --- List All Jobs ---
 @app.get("/api/jobs")
@@ -582,32 +1109,40 @@ async def list_jobs(limit: int = 50):
     """List recent jobs"""
     job_list = [
         {"job_id": jid, **data}
-        for jid, data in list(jobs.items())[-limit:]
+        for jid, data in await get_recent_jobs(limit)
     ]
-    return {
+    return OrjsonResponse({
         "jobs": job_list,
-        "total": len(jobs)
-    }
+        "total": await count_jobs()
+    })
 
 # --- Serve Audio Files ---
 @app.get("/api/audio/{filename}")
-async def get_audio(filename: str):
+async def get_audio(filename: str, request: Request):
     """Serve generated audio files"""
     
-    # Search in output directory and subdirectories
-    def find_file(directory: Path, target: str):
-        for path in directory.rglob(target):
-            if path.is_file():
-                return path
-        return None
-    
-    file_path = find_file(OUTPUT_DIR, filename)
+    # Index hits cost a single stat; misses walk OUTPUT_DIR on a worker thread
+    found = find_indexed_audio(filename) or await asyncio.to_thread(scan_for_audio, filename)
     
-    if file_path and file_path.exists():
+    if found:
+        file_path, stat_result = found
+        headers = {
+            "Cache-Control": AUDIO_CACHE_CONTROL,
+            "ETag": f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+        }
+        
+        # Repeat downloads revalidate without resending the file
+        if request.headers.get("if-none-match") == headers["ETag"]:
+            return Response(status_code=304, headers=headers)
+        
+        # Inline disposition lets <audio> players stream and seek with Range requests
         return FileResponse(
             file_path,
+            stat_result=stat_result,
+            headers=headers,
             media_type="audio/wav",
-            filename=filename
+            filename=filename,
+            content_disposition_type="inline"
         )
     
     raise HTTPException(status_code=404, detail="Audio file not found")
@@ -615,31 +1150,24 @@ async def get_audio(filename: str):
 # --- Delete Job ---
 @app.delete("/api/jobs/{job_id}")
 async def delete_job(job_id: str):
-    """Delete a job from memory"""
-    if job_id not in jobs:
+    """Delete a job from the job store"""
+    job_data = await get_job(job_id)
+    if job_data is None:
         raise HTTPException(status_code=404, detail="Job not found")
     
     # Clean up associated audio file if exists
-    job_data = jobs[job_id]
-    if job_data.get('audio_url'):
-        try:
-            filename = job_data['audio_url'].split('/')[-1]
-            audio_file = OUTPUT_DIR / filename
-            if audio_file.exists():
-                audio_file.unlink()
-        except Exception:
-            pass
+    await asyncio.to_thread(delete_job_audio, job_data)
     
-    del jobs[job_id]
+    await delete_job_record(job_id)
     return {"message": "Job deleted successfully"}
 
 # --- Cleanup Endpoint ---
 @app.post("/api/admin/cleanup")
 async def trigger_cleanup():
     """Manually trigger job cleanup (removes old completed/failed jobs)"""
-    jobs_before = len(jobs)
-    cleanup_old_jobs()
-    jobs_after = len(jobs)
+    jobs_before = await count_jobs()
+    await cleanup_expired_jobs()
+    jobs_after = await count_jobs()
     
     return {
         "message": "Cleanup completed",
@@ -648,24 +1176,36 @@ async def trigger_cleanup():
     }
 
 # --- Example Voices ---
+EXAMPLES_DIR = Path("./audio")
+
+@functools.lru_cache(maxsize=1)
+def list_example_voices(dir_mtime_ns: int) -> list[dict]:
+    """Scan the example voices directory
+    
+    Cached on the directory's mtime, which changes whenever files are added,
+    removed or renamed, so the scan only reruns after such a change.
+    """
+    # os.scandir yields names and cached file types from a single directory read
+    examples = []
+    with os.scandir(EXAMPLES_DIR) as entries:
+        for entry in entries:
+            stem, _, ext = entry.name.rpartition('.')
+            if stem and ext.lower() in AUDIO_EXTENSIONS and entry.is_file():
+                examples.append({
+                    "name": stem,
+                    "filename": entry.name,
+                    "path": entry.path
+                })
+    return examples
+
 @app.get("/api/examples")
 async def get_examples():
     """Get list of example voice files"""
-    audio_dir = Path("./audio")
-    
-    if not audio_dir.exists():
+    try:
+        dir_mtime_ns = EXAMPLES_DIR.stat().st_mtime_ns
+    except OSError:
         return {"examples": []}
-    
-    examples = []
-    for audio_file in audio_dir.glob("*.*"):
-        if audio_file.suffix.lower() in ['.wav', '.mp3', '.flac', '.ogg', '.m4a']:
-            examples.append({
-                "name": audio_file.stem,
-                "filename": audio_file.name,
-                "path": str(audio_file)
-            })
-    
-    return {"examples": examples}
+    return {"examples": list_example_voices(dir_mtime_ns)}
 
 # Mount static files if directory exists
 static_dir = Path("static")
@@ -675,6 +1215,7 @@ if static_dir.exists():
 # --- Main ---
 if __name__ == "__main__":
     import uvicorn
+    from serve import get_worker_count
     
     print("=" * 60)
     print("🎙️  XTTS Voice Cloning API")
@@ -683,6 +1224,13 @@ if __name__ == "__main__":
     print(f"🌍 Languages: {len(SUPPORTED_LANGUAGES)}")
     print(f"📁 Output: {OUTPUT_DIR}")
     print(f"☁️  Codespace: {CODESPACE_NAME if IS_CODESPACE else 'N/A'}")
+    
+    # This process has already loaded the model, so it serves requests itself; a
+    # uvicorn supervisor here would hold a full extra copy of XTTS that never runs.
+    # serve.py starts multiple workers without importing core in the supervisor.
+    if get_worker_count() > 1:
+        print("⚠️ For WORKERS > 1 run `python serve.py` (or the uvicorn CLI) - using 1 worker")
+    print("👷 Workers: 1")
     print("=" * 60)
     print("\n🚀 Starting server...\n")
     
@@ -690,5 +1238,7 @@ if __name__ == "__main__":
         app,
         host="0.0.0.0",
         port=8000,
+        loop="uvloop",
+        http="httptools",
         log_level="info"
     )
@@ -1,15 +1,66 @@
 """
 Core TTS functionality - shared logic without UI dependencies
 """
+import os
+from pathlib import Path
+
+
+def available_cpus() -> int:
+    """CPUs this process may actually use (cgroup quota and affinity aware)."""
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+    try:
+        # cgroup v2 CPU quota, e.g. "200000 100000" for 2 CPUs
+        quota, period = Path("/sys/fs/cgroup/cpu.max").read_text().split()
+        if quota != "max":
+            cpus = min(cpus, max(1, int(quota) // int(period)))
+    except (OSError, ValueError):
+        pass
+    return cpus
+
+
+# CPU thread pools must be sized before torch loads. Containers often see every
+# host core but only get a small CPU quota, and one OpenMP thread per host core
+# then spends most of its time descheduled (override with TORCH_NUM_THREADS)
+CPU_THREADS = int(os.getenv("TORCH_NUM_THREADS", "0")) or available_cpus()
+os.environ.setdefault("OMP_NUM_THREADS", str(CPU_THREADS))
+os.environ.setdefault("MKL_NUM_THREADS", str(CPU_THREADS))
+
+# Let the CUDA caching allocator grow segments instead of fragmenting, so cached
+# blocks are reused across requests without being released between them
+os.environ.setdefault("PYTORCH_CUDA_ALLOC_CONF", "expandable_segments:True")
+
+import numpy as np
 import torch
 from TTS.api import TTS
-import os
 import time
 import gc
-from pathlib import Path
+import logging
 import uuid
 from datetime import datetime
 import shutil
+import functools
+import itertools
+import fnmatch
+import wave
+import hashlib
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+
+# --- Logging ---
+# Per-request messages go through logging so the chattier ones cost nothing
+# unless enabled (LOG_LEVEL=DEBUG adds text previews and progress steps)
+log = logging.getLogger("lyrebird")
+if not log.handlers:
+    log_handler = logging.StreamHandler()
+    log_handler.setFormatter(logging.Formatter("%(message)s"))
+    log.addHandler(log_handler)
+    log.propagate = False
+log.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
 
 # --- Configuration ---
 os.environ["COQUI_TOS_AGREED"] = "1"
@@ -27,7 +78,9 @@ elif torch.backends.mps.is_available():
     print("🍎 Apple Silicon detected - using MPS acceleration")
 else:
     device = "cpu"
+    torch.set_num_threads(CPU_THREADS)
     print("💻 Running on CPU (expect slower performance)")
+    print(f"🧵 CPU threads: {CPU_THREADS}")
 
 # ✅ Complete XTTS v2 language support
 SUPPORTED_LANGUAGES = {
@@ -50,6 +103,11 @@ SUPPORTED_LANGUAGES = {
     "Hindi": "hi"
 }
 
+# Input validation limits shared with the API
+AUDIO_EXTENSIONS = frozenset({"wav", "mp3", "flac", "ogg", "m4a"})  # Accepted reference audio formats
+MIN_TEXT_CHARS = 3
+MAX_TEXT_CHARS = 2000
+
 # --- Storage Configuration for Codespaces ---
 if IS_CODESPACE:
     WORKSPACE_DIR = Path("/workspaces").resolve()
@@ -67,7 +125,8 @@ TEMP_DIR.mkdir(parents=True, exist_ok=True)
 
 # --- Global variables for progress prediction ---
 AVERAGE_RTF = None  # Real-time factor (processing_time / audio_duration)
-RTF_HISTORY = []    # Store last 5 RTF values for averaging
+RTF_HISTORY = deque(maxlen=5)  # Last 5 RTF values for averaging (oldest drop off)
+rtf_lock = threading.Lock()    # Concurrent generations update the history together
 
 # --- Model Initialization ---
 MODEL_CACHE_DIR = OUTPUT_DIR.parent / ".cache" / "tts_models"
@@ -82,6 +141,8 @@ try:
     tts = TTS("tts_models/multilingual/multi-dataset/xtts_v2")
     print("Moving model to device...")
     tts = tts.to(device)
+    # Inference only: parameters never need gradients
+    tts.eval().requires_grad_(False)
     print("✅ TTS Model loaded successfully")
     print(f"📊 Supported languages: {len(SUPPORTED_LANGUAGES)}")
     print(f"⚙️ Device: {device.upper()}\n")
@@ -91,44 +152,301 @@ except Exception as e:
     traceback.print_exc()
     raise
 
+# --- Inference Precision (TTS_PRECISION=fp32|fp16|bf16) ---
+# Half precision runs XTTS under CUDA autocast: matmuls use Tensor Cores and
+# activations take half the memory, while autocast keeps numerically sensitive
+# ops (norms, softmax) in fp32. Speaker conditioning runs outside autocast, in fp32.
+TTS_PRECISION = os.getenv("TTS_PRECISION", "fp32").lower()
+AUTOCAST_DTYPES = {"fp16": torch.float16, "bf16": torch.bfloat16}
+autocast_dtype = None
+
+if TTS_PRECISION in AUTOCAST_DTYPES:
+    if device != "cuda":
+        print(f"⚠️ TTS_PRECISION={TTS_PRECISION} requires CUDA - using fp32\n")
+    elif TTS_PRECISION == "bf16" and not torch.cuda.is_bf16_supported():
+        print("⚠️ bf16 not supported on this GPU - using fp16\n")
+        autocast_dtype = torch.float16
+    else:
+        autocast_dtype = AUTOCAST_DTYPES[TTS_PRECISION]
+    if autocast_dtype is not None:
+        print(f"🎯 Inference precision: {str(autocast_dtype).replace('torch.', '')} autocast\n")
+elif TTS_PRECISION != "fp32":
+    print(f"⚠️ Unknown TTS_PRECISION '{TTS_PRECISION}' - using fp32\n")
+
+def inference_autocast():
+    """Autocast context for XTTS calls (a no-op in fp32)
+    
+    Used together with torch.inference_mode(): grad mode is per thread, so it is
+    entered around each generation rather than switched off once at import.
+    """
+    if autocast_dtype is None:
+        return nullcontext()
+    return torch.autocast(device_type="cuda", dtype=autocast_dtype)
+
+# --- Optional ONNX Runtime HiFi-GAN decoder (XTTS_ONNX_DECODER=true) ---
+# The decoder is a feed-forward conv net, so it exports cleanly to ONNX and can run
+# on TensorRT (fp16) or ONNX Runtime's CUDA/CPU kernels. The export is cached next
+# to the model; the PyTorch decoder stays in place if anything fails.
+USE_ONNX_DECODER = os.getenv("XTTS_ONNX_DECODER") == "true"
+ONNX_DECODER_PATH = MODEL_CACHE_DIR / "xtts_hifigan_decoder.onnx"
+TRT_ENGINE_CACHE_DIR = MODEL_CACHE_DIR / "tensorrt"
+onnx_decoder_active = False
+
+
+class OnnxHifiganDecoder(torch.nn.Module):
+    """Drop-in replacement for XTTS's HiFi-GAN decoder running on ONNX Runtime."""
+    
+    def __init__(self, session, torch_decoder: torch.nn.Module):
+        super().__init__()
+        self.session = session
+        # Xtts still uses the decoder's speaker encoder (and other attributes)
+        self.torch_decoder = torch_decoder
+    
+    def __getattr__(self, name):
+        try:
+            return super().__getattr__(name)
+        except AttributeError:
+            return getattr(self._modules["torch_decoder"], name)
+    
+    def forward(self, latents: torch.Tensor, g: torch.Tensor = None) -> torch.Tensor:
+        latents = latents.float().contiguous()
+        g = g.float().contiguous()
+        
+        if latents.is_cuda:
+            # Bind the GPU tensors directly so the latents never round-trip through host memory
+            binding = self.session.io_binding()
+            for name, tensor in (("latents", latents), ("g", g)):
+                binding.bind_input(
+                    name, "cuda", tensor.device.index or 0, np.float32, tuple(tensor.shape), tensor.data_ptr()
+                )
+            binding.bind_output("wav")  # Xtts moves the waveform to the CPU anyway
+            # ONNX Runtime runs on its own CUDA stream and does not wait for torch's, so
+            # make sure the GPT has finished writing the latents before they are read
+            torch.cuda.current_stream().synchronize()
+            self.session.run_with_iobinding(binding)
+            wav = binding.copy_outputs_to_cpu()[0]
+        else:
+            wav = self.session.run(None, {"latents": latents.numpy(), "g": g.numpy()})[0]
+        return torch.from_numpy(wav)
+
+
+def load_onnx_decoder(torch_decoder: torch.nn.Module) -> OnnxHifiganDecoder:
+    """Export the HiFi-GAN decoder to ONNX (once) and open an ONNX Runtime session for it."""
+    import onnxruntime as ort
+    
+    if not ONNX_DECODER_PATH.exists():
+        print("📤 Exporting HiFi-GAN decoder to ONNX...")
+        # XTTS v2 shapes: GPT latents (batch, frames, 1024), speaker embedding (batch, 512, 1)
+        dummy_latents = torch.randn(1, 64, 1024, device=device)
+        dummy_g = torch.randn(1, 512, 1, device=device)
+        with torch.no_grad():
+            torch.onnx.export(
+                torch_decoder,
+                (dummy_latents, dummy_g),
+                str(ONNX_DECODER_PATH),
+                input_names=["latents", "g"],
+                output_names=["wav"],
+                dynamic_axes={"latents": {1: "frames"}, "wav": {2: "samples"}},
+                opset_version=17
+            )
+    
+    available = ort.get_available_providers()
+    providers = ["CPUExecutionProvider"]
+    if device == "cuda":
+        if "CUDAExecutionProvider" in available:
+            providers.insert(0, "CUDAExecutionProvider")
+        if "TensorrtExecutionProvider" in available:
+            # One optimization profile covering every sentence length the GPT can produce,
+            # so TensorRT never rebuilds its engine on the request path; built engines are
+            # cached on disk and reused across restarts
+            max_frames = tts.synthesizer.tts_model.args.gpt_max_audio_tokens
+            TRT_ENGINE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            providers.insert(0, ("TensorrtExecutionProvider", {
+                "trt_fp16_enable": True,
+                "trt_profile_min_shapes": "latents:1x1x1024",
+                "trt_profile_opt_shapes": f"latents:1x{max_frames // 2}x1024",
+                "trt_profile_max_shapes": f"latents:1x{max_frames}x1024",
+                "trt_engine_cache_enable": True,
+                "trt_engine_cache_path": str(TRT_ENGINE_CACHE_DIR)
+            }))
+    session = ort.InferenceSession(str(ONNX_DECODER_PATH), providers=providers)
+    print(f"🧩 HiFi-GAN decoder on ONNX Runtime ({session.get_providers()[0]})\n")
+    return OnnxHifiganDecoder(session, torch_decoder)
+
+
+if USE_ONNX_DECODER:
+    try:
+        xtts_model = tts.synthesizer.tts_model
+        xtts_model.hifigan_decoder = load_onnx_decoder(xtts_model.hifigan_decoder)
+        onnx_decoder_active = True
+    except ImportError:
+        print("⚠️ onnxruntime not installed - using the PyTorch decoder\n")
+    except Exception as e:
+        print(f"⚠️ ONNX decoder unavailable, using the PyTorch decoder: {e}\n")
+
+# --- Optional torch.compile (XTTS_COMPILE=true, CUDA only) ---
+# "reduce-overhead" replays the HiFi-GAN decoder through CUDA graphs, removing the
+# per-kernel launch overhead that dominates its many small convolutions. A graph is
+# recorded per input shape, so latents are zero-padded up to a multiple of
+# DECODER_FRAME_BUCKET frames and the waveform trimmed back; a handful of graphs
+# then cover every sentence length. The GPT runs a token-by-token generate() loop
+# with a growing KV cache, which does not fit static graph capture, so it stays eager.
+USE_TORCH_COMPILE = os.getenv("XTTS_COMPILE") == "true"
+DECODER_FRAME_BUCKET = 32
+
+
+class BucketedDecoder(torch.nn.Module):
+    """Runs a compiled HiFi-GAN decoder on latents padded to a fixed frame bucket."""
+    
+    def __init__(self, compiled_decoder: torch.nn.Module):
+        super().__init__()
+        self.compiled_decoder = compiled_decoder
+    
+    def __getattr__(self, name):
+        try:
+            return super().__getattr__(name)
+        except AttributeError:
+            return getattr(self._modules["compiled_decoder"], name)
+    
+    def forward(self, latents: torch.Tensor, g: torch.Tensor = None) -> torch.Tensor:
+        frames = latents.shape[1]
+        padded_frames = -(-frames // DECODER_FRAME_BUCKET) * DECODER_FRAME_BUCKET
+        latents = torch.nn.functional.pad(latents, (0, 0, 0, padded_frames - frames))
+        wav = self.compiled_decoder(latents, g=g)
+        # Each output frame maps to a fixed number of samples; clone so the next
+        # graph replay cannot overwrite a waveform that is still in use
+        return wav[..., : wav.shape[-1] * frames // padded_frames].clone()
+
+if USE_TORCH_COMPILE and device == "cuda" and not onnx_decoder_active:
+    try:
+        import torch._dynamo
+        torch._dynamo.config.suppress_errors = True  # Fall back to eager if a graph fails to compile
+        xtts_model = tts.synthesizer.tts_model
+        xtts_model.hifigan_decoder = BucketedDecoder(
+            torch.compile(xtts_model.hifigan_decoder, mode="reduce-overhead")
+        )
+        print("⚡ HiFi-GAN decoder compiled with torch.compile (reduce-overhead)\n")
+    except Exception as e:
+        print(f"⚠️ torch.compile unavailable, running eagerly: {e}\n")
+
+# --- Optional INT8 GPT (XTTS_INT8=true, CPU only) ---
+# On CPU the autoregressive GPT is memory-bandwidth bound; dynamic int8
+# quantization stores its weights in a quarter of the bytes and uses int8 dot
+# products. The HiFi-GAN decoder is convolutional and stays in fp32.
+USE_INT8_GPT = os.getenv("XTTS_INT8") == "true"
+
+
+def conv1d_to_linear(module: torch.nn.Module):
+    """Replace GPT-2's transformers Conv1D layers with equivalent nn.Linear ones (in place).
+    
+    XTTS's GPT is a Hugging Face GPT-2, whose attention and MLP projections are
+    Conv1D modules that quantize_dynamic would otherwise skip.
+    """
+    from transformers.pytorch_utils import Conv1D
+    
+    for name, child in module.named_children():
+        if isinstance(child, Conv1D):
+            in_features, out_features = child.weight.shape
+            linear = torch.nn.Linear(in_features, out_features)
+            linear.weight.data = child.weight.data.t().contiguous()
+            linear.bias.data = child.bias.data
+            setattr(module, name, linear)
+        else:
+            conv1d_to_linear(child)
+
+
+if USE_INT8_GPT and device == "cpu":
+    try:
+        import platform
+        if platform.machine().lower() in ("arm64", "aarch64"):
+            torch.backends.quantized.engine = "qnnpack"
+        
+        # In place, so the inference wrapper that shares the GPT's layers sees them too
+        gpt = tts.synthesizer.tts_model.gpt
+        conv1d_to_linear(gpt)
+        torch.ao.quantization.quantize_dynamic(gpt, {torch.nn.Linear}, dtype=torch.qint8, inplace=True)
+        print("🔢 XTTS GPT quantized to int8\n")
+    except Exception as e:
+        print(f"⚠️ INT8 quantization failed, using fp32: {e}\n")
+
 # --- Initialize Punctuation Model ---
-print("🔤 Loading punctuation restoration model...")
+# The model is loaded lazily on the punctuation worker thread, so importing this
+# module does not block on it; it is preloaded in the background unless
+# PUNCTUATION_PRELOAD=false, in which case the first request loads it.
+PUNCTUATION_PRELOAD = os.getenv("PUNCTUATION_PRELOAD", "true") == "true"
+
+# The punctuation model (XLM-RoBERTa) runs on CPU unless CUDA is available; there
+# its Linear layers are quantized to int8 (set PUNCTUATION_INT8=false to keep fp32)
+USE_INT8_PUNCTUATION = os.getenv("PUNCTUATION_INT8", "true") == "true"
+
 punct_model = None
-try:
-    from deepmultilingualpunctuation import PunctuationModel
-    punct_model = PunctuationModel()
-    print("✅ Punctuation model loaded successfully")
-    print("   TTS will use punctuation for automatic sentence splitting\n")
-except ImportError:
-    print("⚠️ deepmultilingualpunctuation not installed")
-    print("   Install with: pip install deepmultilingualpunctuation")
-    print("   Without it, TTS splitting may not work properly\n")
-except Exception as e:
-    print(f"⚠️ Punctuation model failed to load: {e}\n")
 
 
+@functools.lru_cache(maxsize=1)
+def load_punctuation_model():
+    """Load (and on CPU quantize) the punctuation model; returns None if unavailable."""
+    global punct_model
+    log.info("🔤 Loading punctuation restoration model...")
+    try:
+        from deepmultilingualpunctuation import PunctuationModel
+        model = PunctuationModel()
+    except ImportError:
+        log.warning("⚠️ deepmultilingualpunctuation not installed")
+        log.warning("   Install with: pip install deepmultilingualpunctuation")
+        log.warning("   Without it, TTS splitting may not work properly")
+        return None
+    except Exception as e:
+        log.warning("⚠️ Punctuation model failed to load: %s", e)
+        return None
+    
+    if USE_INT8_PUNCTUATION and model.pipe.device.type == "cpu":
+        try:
+            torch.ao.quantization.quantize_dynamic(
+                model.pipe.model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+            )
+            log.info("🔢 Punctuation model quantized to int8")
+        except Exception as e:
+            log.warning("⚠️ Punctuation quantization failed, using fp32: %s", e)
+    
+    punct_model = model
+    log.info("✅ Punctuation model loaded successfully")
+    log.info("   TTS will use punctuation for automatic sentence splitting")
+    return model
+
+
+# Punctuation restoration runs here so it overlaps with speaker conditioning
+# (one worker: requests share the model, which is not meant for concurrent use)
+punctuation_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="punctuation")
+
+if PUNCTUATION_PRELOAD:
+    punctuation_executor.submit(load_punctuation_model)
+
+
+@functools.lru_cache(maxsize=256)
 def restore_punctuation(text: str) -> str:
     """
     Add punctuation using deepmultilingualpunctuation.
     This allows TTS to automatically split text into sentences.
+    Results are cached, so regenerating the same text skips the model.
+    Long inputs are already chunked by the library (overlapping word windows).
     """
     if not text or not text.strip():
         return text
     
     text = text.strip()
     
-    if punct_model is not None:
+    model = load_punctuation_model()
+    if model is not None:
         try:
-            print("🔤 Restoring punctuation for TTS sentence splitting...")
-            punctuated_text = punct_model.restore_punctuation(text)
-            print(f"✅ Punctuation added - TTS will now split automatically")
+            log.debug("🔤 Restoring punctuation for TTS sentence splitting...")
+            punctuated_text = model.restore_punctuation(text)
+            log.debug("✅ Punctuation added - TTS will now split automatically")
             return punctuated_text
         except Exception as e:
-            print(f"⚠️ Punctuation restoration failed: {e}")
-            print("   TTS may not split properly without punctuation")
+            log.warning("⚠️ Punctuation restoration failed (TTS may not split properly): %s", e)
             return text
     else:
-        print("⚠️ Punctuation model not available")
+        log.debug("⚠️ Punctuation model not available")
         # Basic fallback - add period at end
         if text and text[-1] not in '.!?':
             text += '.'
@@ -155,57 +473,58 @@ def estimate_audio_duration(text: str, language: str = "en") -> float:
 
 def update_rtf(processing_time: float, audio_duration: float):
     """Update real-time factor history for better predictions."""
-    global AVERAGE_RTF, RTF_HISTORY
+    global AVERAGE_RTF
     
     rtf = processing_time / audio_duration if audio_duration > 0 else 2.0
     
-    RTF_HISTORY.append(rtf)
-    if len(RTF_HISTORY) > 5:  # Keep last 5 measurements
-        RTF_HISTORY.pop(0)
+    with rtf_lock:
+        RTF_HISTORY.append(rtf)
+        AVERAGE_RTF = sum(RTF_HISTORY) / len(RTF_HISTORY)
     
-    AVERAGE_RTF = sum(RTF_HISTORY) / len(RTF_HISTORY)
-    
-    print(f"📊 Real-time factor: {rtf:.2f}x (avg: {AVERAGE_RTF:.2f}x)")
+    log.info("📊 Real-time factor: %.2fx (avg: %.2fx)", rtf, AVERAGE_RTF)
 
 
 def get_audio_duration(file_path: str) -> float:
-    """Get actual audio duration from generated file."""
+    """Get actual audio duration from generated file (reads only the WAV header)."""
     try:
-        from pydub import AudioSegment
-        audio = AudioSegment.from_wav(file_path)
-        return len(audio) / 1000.0  # Convert ms to seconds
-    except ImportError:
+        with wave.open(file_path, "rb") as w:
+            return w.getnframes() / w.getframerate()
+    except wave.Error:
         # Fallback: estimate from file size (very rough)
         file_size = Path(file_path).stat().st_size
-        # WAV: ~176KB per second (44.1kHz, 16-bit, stereo)
-        return file_size / 176000
+        # XTTS output: ~48KB per second (24kHz, 16-bit, mono)
+        return file_size / 48000
     except Exception as e:
-        print(f"⚠️ Could not get audio duration: {e}")
+        log.warning("⚠️ Could not get audio duration: %s", e)
         return 0
 
 
-def cleanup_old_outputs(directory: Path, max_age_hours: int = 4):
-    """Remove old output files."""
+def cleanup_old_outputs(directory: Path, max_age_hours: int = 4, pattern: str = "*.wav"):
+    """Remove old output files matching pattern."""
     if not directory.exists():
         return
     
     cutoff = time.time() - (max_age_hours * 3600)
     removed = 0
     
-    for file in directory.glob("*.wav"):
-        try:
-            if file.stat().st_mtime < cutoff:
-                file.unlink()
-                removed += 1
-        except Exception:
-            pass
+    # scandir entries carry their names and file types, so each file costs one stat
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            try:
+                if (fnmatch.fnmatch(entry.name, pattern)
+                        and entry.is_file(follow_symlinks=False)
+                        and entry.stat(follow_symlinks=False).st_mtime < cutoff):
+                    os.unlink(entry.path)
+                    removed += 1
+            except OSError:
+                pass
     
     if removed > 0:
-        print(f"🗑️ Cleaned up {removed} old file(s)")
+        log.info("🗑️ Cleaned up %d old file(s)", removed)
 
 
 def save_with_organization(local_file: Path, language: str) -> tuple[str, str]:
-    """Organize files by date and language."""
+    """Organize files by date and language (moves the file into place)."""
     try:
         date_folder = OUTPUT_DIR / datetime.now().strftime("%Y-%m-%d")
         date_folder.mkdir(exist_ok=True)
@@ -216,22 +535,216 @@ def save_with_organization(local_file: Path, language: str) -> tuple[str, str]:
         timestamp = datetime.now().strftime("%H%M%S")
         organized_file = lang_folder / f"clone_{timestamp}_{local_file.stem}.wav"
         
-        shutil.copy(str(local_file), str(organized_file))
+        # A rename when both paths share a filesystem, otherwise copy-and-delete
+        shutil.move(str(local_file), str(organized_file))
         
         try:
             relative_path = organized_file.relative_to(OUTPUT_DIR)
         except ValueError:
             relative_path = organized_file.name
         
-        print(f"💾 Saved to: {relative_path}")
+        log.info("💾 Saved to: %s", relative_path)
         
         return str(organized_file), str(relative_path)
         
     except Exception as e:
-        print(f"⚠️ Organization failed: {e}")
+        log.warning("⚠️ Organization failed: %s", e)
         return str(local_file), str(local_file.name)
 
 
+SENTENCE_PAUSE_SAMPLES = 10000  # Silence between sentences, as in Coqui's Synthesizer
+GC_EVERY_N_GENERATIONS = 100  # Full garbage collection interval
+generation_counter = itertools.count(1)
+
+# Optional (XTTS_CUDA_STREAMS=true, CUDA only): the GPT of sentence N+1 runs on one
+# stream while HiFi-GAN decodes sentence N on another; the host waits once, after the
+# last sentence. This replaces Xtts.inference() with generate_gpt_latents(), which
+# mirrors the installed TTS version's internals. ONNX Runtime manages its own
+# streams, so this is off when the ONNX decoder is active.
+USE_CUDA_STREAMS = (
+    device == "cuda"
+    and not onnx_decoder_active
+    and os.getenv("XTTS_CUDA_STREAMS") == "true"
+)
+if USE_CUDA_STREAMS:
+    gpt_stream = torch.cuda.Stream()
+    vocoder_stream = torch.cuda.Stream()
+
+# --- Speaker Conditioning Cache ---
+# Uploads get a fresh temp path every time, so latents are keyed by file content
+SPEAKER_CACHE_SIZE = 32
+speaker_cache: OrderedDict = OrderedDict()  # content hash -> (gpt_cond_latent, speaker_embedding)
+speaker_cache_lock = threading.Lock()
+
+
+def get_speaker_latents(speaker_wav: str):
+    """
+    Get XTTS conditioning latents for a reference clip, reusing cached ones for identical audio.
+    
+    A cache hit skips decoding, resampling and encoding the reference entirely;
+    on a miss XTTS loads the clip once and derives both latents from it.
+    """
+    digest = hashlib.blake2b()
+    with open(speaker_wav, "rb") as f:
+        while chunk := f.read(1 << 20):
+            digest.update(chunk)
+    key = digest.hexdigest()
+    
+    with speaker_cache_lock:
+        latents = speaker_cache.get(key)
+        if latents is not None:
+            speaker_cache.move_to_end(key)
+            log.debug("♻️ Reusing cached speaker conditioning")
+            return latents
+    
+    model = tts.synthesizer.tts_model
+    config = model.config
+    latents = model.get_conditioning_latents(
+        audio_path=[speaker_wav],
+        gpt_cond_len=config.gpt_cond_len,
+        gpt_cond_chunk_len=config.gpt_cond_chunk_len,
+        max_ref_length=config.max_ref_len,
+        sound_norm_refs=config.sound_norm_refs
+    )
+    
+    with speaker_cache_lock:
+        speaker_cache[key] = latents
+        if len(speaker_cache) > SPEAKER_CACHE_SIZE:
+            speaker_cache.popitem(last=False)
+    return latents
+
+
+def write_wav(wav: np.ndarray, file_path: str, sample_rate: int):
+    """
+    Write float audio as 16-bit mono PCM with a single write call.
+    
+    Peak-normalizes like Coqui's save_wav, so output levels are unchanged.
+    """
+    pcm = (wav * (32767 / max(0.01, np.max(np.abs(wav))))).astype(np.int16)
+    with wave.open(file_path, "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(sample_rate)
+        w.writeframes(pcm.tobytes())
+
+
+def generate_gpt_latents(sentence: str, lang_code: str, gpt_cond_latent: torch.Tensor) -> torch.Tensor:
+    """
+    GPT half of Xtts.inference(): sample audio codes for one sentence and return
+    the latents HiFi-GAN decodes. Sampling settings match synthesize_to_file().
+    """
+    model = tts.synthesizer.tts_model
+    config = model.config
+    language = lang_code.split("-")[0]  # Xtts drops the region (zh-cn -> zh)
+    
+    text_tokens = torch.IntTensor(
+        model.tokenizer.encode(sentence.strip().lower(), lang=language)
+    ).unsqueeze(0).to(device)
+    max_text_tokens = model.args.gpt_max_text_tokens
+    if text_tokens.shape[-1] >= max_text_tokens:
+        raise ValueError(f"XTTS can only generate text with a maximum of {max_text_tokens} tokens.")
+    
+    gpt_codes = model.gpt.generate(
+        cond_latents=gpt_cond_latent,
+        text_inputs=text_tokens,
+        input_tokens=None,
+        do_sample=True,
+        top_p=config.top_p,
+        top_k=config.top_k,
+        temperature=config.temperature,
+        num_return_sequences=model.gpt_batch_size,
+        num_beams=1,
+        length_penalty=config.length_penalty,
+        repetition_penalty=config.repetition_penalty,
+        output_attentions=False
+    )
+    expected_output_len = torch.tensor([gpt_codes.shape[-1] * model.gpt.code_stride_len], device=device)
+    text_len = torch.tensor([text_tokens.shape[-1]], device=device)
+    return model.gpt(
+        text_tokens,
+        text_len,
+        gpt_codes,
+        expected_output_len,
+        cond_latents=gpt_cond_latent,
+        return_attentions=False,
+        return_latent=True
+    )
+
+
+def synthesize_sentences_on_streams(sentences: list, lang_code: str, gpt_cond_latent: torch.Tensor,
+                                    speaker_embedding: torch.Tensor) -> list:
+    """
+    Synthesize sentences with GPT and HiFi-GAN on separate CUDA streams.
+    
+    Each decode only waits for its own sentence's latents, so while the vocoder
+    works on sentence N the host is already sampling sentence N+1 on the GPT stream.
+    Returns one CPU waveform per sentence.
+    """
+    decoder = tts.synthesizer.tts_model.hifigan_decoder
+    gpt_cond_latent = gpt_cond_latent.to(device)
+    speaker_embedding = speaker_embedding.to(device)
+    
+    current_stream = torch.cuda.current_stream()
+    gpt_stream.wait_stream(current_stream)
+    vocoder_stream.wait_stream(current_stream)
+    
+    wavs = []
+    for sentence in sentences:
+        with torch.cuda.stream(gpt_stream):
+            gpt_latents = generate_gpt_latents(sentence, lang_code, gpt_cond_latent)
+        vocoder_stream.wait_stream(gpt_stream)
+        with torch.cuda.stream(vocoder_stream):
+            # Keep the allocator from reusing the latents before the vocoder is done
+            gpt_latents.record_stream(vocoder_stream)
+            wavs.append(decoder(gpt_latents, g=speaker_embedding).squeeze())
+    
+    current_stream.wait_stream(vocoder_stream)
+    return [wav.cpu() for wav in wavs]
+
+
+def synthesize_to_file(text: str, speaker_latents: tuple, lang_code: str, file_path: str):
+    """
+    Synthesize text sentence by sentence, conditioning on the speaker only once.
+    
+    tts.tts_to_file() goes through Xtts.synthesize(), which recomputes the speaker
+    conditioning latents from the reference audio for every sentence. Here the
+    latents from get_speaker_latents() are reused for every sentence; sentence
+    splitting, sampling settings and the pause between sentences match
+    tts_to_file().
+    """
+    model = tts.synthesizer.tts_model
+    config = model.config
+    
+    gpt_cond_latent, speaker_embedding = speaker_latents
+    
+    sentences = tts.synthesizer.split_into_sentences(text)
+    if USE_CUDA_STREAMS:
+        sentence_wavs = synthesize_sentences_on_streams(sentences, lang_code, gpt_cond_latent, speaker_embedding)
+    else:
+        sentence_wavs = [
+            model.inference(
+                sentence,
+                lang_code,
+                gpt_cond_latent,
+                speaker_embedding,
+                temperature=config.temperature,
+                length_penalty=config.length_penalty,
+                repetition_penalty=config.repetition_penalty,
+                top_k=config.top_k,
+                top_p=config.top_p
+            )["wav"]
+            for sentence in sentences
+        ]
+    
+    pause = np.zeros(SENTENCE_PAUSE_SAMPLES, dtype=np.float32)
+    wavs = []
+    for wav in sentence_wavs:
+        wavs.append(np.asarray(wav, dtype=np.float32).squeeze())
+        wavs.append(pause)
+    
+    write_wav(np.concatenate(wavs), file_path, tts.synthesizer.output_sample_rate)
+
+
 def clone_voice_sync(text: str, audio_path: str, language: str, progress_callback=None) -> tuple[str | None, str]:
     """
     Generate cloned voice with automatic punctuation restoration.
@@ -250,71 +763,77 @@ def clone_voice_sync(text: str, audio_path: str, language: str, progress_callbac
         """Helper to report progress if callback provided"""
         if progress_callback:
             progress_callback(progress, message)
-        print(f"[{int(progress*100)}%] {message}")
+        log.debug("[%d%%] %s", int(progress * 100), message)
     
     # Validation
     report_progress(0.1, "🔍 Validating inputs...")
     
-    if not text or not text.strip():
+    text = text.strip() if text else ""
+    text_length = len(text)
+    
+    if not text_length:
         return None, "⚠️ Please enter text to synthesize."
     
-    text = text.strip()
+    if text_length > MAX_TEXT_CHARS:
+        return None, f"⚠️ Text too long ({text_length} chars). Maximum: {MAX_TEXT_CHARS} characters."
     
-    if len(text) > 2000:
-        return None, f"⚠️ Text too long ({len(text)} chars). Maximum: 2000 characters."
+    if text_length < MIN_TEXT_CHARS:
+        return None, f"⚠️ Text too short. Please enter at least {MIN_TEXT_CHARS} characters."
     
-    if len(text) < 3:
-        return None, "⚠️ Text too short. Please enter at least 3 characters."
+    lang_code = SUPPORTED_LANGUAGES.get(language)
+    if lang_code is None:
+        return None, f"⚠️ Unsupported language: {language}"
     
     if not audio_path:
         return None, "⚠️ Please upload a voice reference audio file."
     
-    if not audio_path.lower().endswith(('.wav', '.mp3', '.flac', '.ogg', '.m4a')):
+    if os.path.splitext(audio_path)[1][1:].lower() not in AUDIO_EXTENSIONS:
         return None, "⚠️ Unsupported format. Use: WAV, MP3, FLAC, OGG, or M4A."
     
-    # Restore punctuation (critical for TTS sentence splitting!)
+    # Restore punctuation (critical for TTS sentence splitting!) on a helper
+    # thread while the speaker conditioning is prepared below
     report_progress(0.3, "🔤 Processing text...")
     
-    original_text = text
-    text = restore_punctuation(text)
+    punctuated = punctuation_executor.submit(restore_punctuation, text)
     
-    if text != original_text:
-        print(f"\n📝 Original text: {original_text[:150]}...")
-        print(f"✅ With punctuation: {text[:150]}...\n")
-    
-    # Estimate processing time
-    lang_code = SUPPORTED_LANGUAGES[language]
+    # Estimate processing time (restoring punctuation does not change the word count)
     estimated_audio_duration = estimate_audio_duration(text, lang_code)
     
     if AVERAGE_RTF is not None:
         estimated_processing_time = estimated_audio_duration * AVERAGE_RTF
-        print(f"📊 Using learned RTF: {AVERAGE_RTF:.2f}x")
-        print(f"📊 Estimated processing time: {estimated_processing_time:.1f}s")
+        log.debug("📊 Using learned RTF: %.2fx", AVERAGE_RTF)
+        log.debug("📊 Estimated processing time: %.1fs", estimated_processing_time)
     else:
         default_rtf = 3.0 if device == "cpu" else 0.5
         estimated_processing_time = estimated_audio_duration * default_rtf
-        print(f"📊 First run - using default RTF: {default_rtf:.2f}x")
-        print(f"📊 Estimated processing time: {estimated_processing_time:.1f}s")
+        log.debug("📊 First run - using default RTF: %.2fx", default_rtf)
+        log.debug("📊 Estimated processing time: %.1fs", estimated_processing_time)
     
     report_progress(0.5, f"🎙️ Generating {language} speech...")
     
     temp_file = TEMP_DIR / f"temp_{uuid.uuid4().hex[:8]}.wav"
     
     try:
-        preview = text[:100] + "..." if len(text) > 100 else text
-        print(f"🎤 Generating speech in {language}")
-        print(f"📝 Text: {preview}")
+        log.info("🎤 Generating speech in %s", language)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("📝 Text: %s", text[:100] + "..." if len(text) > 100 else text)
         
         # Track actual processing time
         start_time = time.time()
         
-        # TTS will automatically split by sentences (using punctuation)
-        tts.tts_to_file(
-            text=text,
-            speaker_wav=audio_path,
-            language=lang_code,
-            file_path=str(temp_file)
-        )
+        with torch.inference_mode():
+            # Speaker conditioning stays in fp32: the latents are cached and reused by
+            # every later request for this voice
+            speaker_latents = get_speaker_latents(audio_path)
+            
+            original_text, text = text, punctuated.result()
+            if text != original_text and log.isEnabledFor(logging.DEBUG):
+                log.debug("📝 Original text: %s...", original_text[:150])
+                log.debug("✅ With punctuation: %s...", text[:150])
+            
+            # Split into sentences (using punctuation) and synthesize them in turn
+            with inference_autocast():
+                synthesize_to_file(text, speaker_latents, lang_code, str(temp_file))
         
         processing_time = time.time() - start_time
         
@@ -329,15 +848,19 @@ def clone_voice_sync(text: str, audio_path: str, language: str, progress_callbac
         
         report_progress(0.95, "🧹 Cleaning up...")
         
-        # Cleanup
-        if device == "cuda":
-            torch.cuda.empty_cache()
-        gc.collect()
-        cleanup_old_outputs(TEMP_DIR, max_age_hours=2)
+        # Cached CUDA blocks are kept for the next request; a full GC pass only
+        # runs occasionally, since scanning every object on each call is wasted work
+        if next(generation_counter) % GC_EVERY_N_GENERATIONS == 0:
+            gc.collect()
+        
+        # Sweep old temp files without delaying the response
+        threading.Thread(
+            target=cleanup_old_outputs, args=(TEMP_DIR,), kwargs={"max_age_hours": 2}, daemon=True
+        ).start()
         
         report_progress(1.0, "✅ Complete!")
         
-        print(f"✅ Generation complete\n")
+        log.info("✅ Generation complete")
         
         # Success message
         success_msg = f"✅ Voice cloning completed successfully!\n\n"
@@ -351,13 +874,49 @@ def clone_voice_sync(text: str, audio_path: str, language: str, progress_callbac
     except Exception as e:
         if temp_file.exists():
             temp_file.unlink()
+        if device == "cuda" and isinstance(e, torch.cuda.OutOfMemoryError):
+            # Hand fragmented cached blocks back so the next request can allocate
+            torch.cuda.empty_cache()
         error_msg = f"❌ Generation failed: {str(e)}"
-        print(error_msg)
-        import traceback
-        traceback.print_exc()
+        log.exception(error_msg)
         return None, error_msg
 
 
+# --- Warmup ---
+# The first inference pays for CUDA context and cuBLAS setup, kernel selection and
+# any torch.compile work. Doing it at startup keeps that stall out of the first
+# request and out of the learned RTF (set XTTS_WARMUP_RUNS=0 to skip).
+WARMUP_RUNS = int(os.getenv("XTTS_WARMUP_RUNS", "2" if device == "cuda" else "0"))
+WARMUP_TEXT = "Hello world, this is a short warmup sentence."
+
+
+def warmup_model(runs: int):
+    """Run dummy generations, seeding the RTF history from the last one."""
+    model = tts.synthesizer.tts_model
+    # Neutral conditioning with XTTS v2's latent shapes (32 x 1024 GPT latents, 512-d speaker)
+    gpt_cond_latent = torch.zeros(1, 32, 1024, device=device)
+    speaker_embedding = torch.zeros(1, 512, 1, device=device)
+    
+    for i in range(runs):
+        start_time = time.time()
+        with torch.inference_mode(), inference_autocast():
+            outputs = model.inference(WARMUP_TEXT, "en", gpt_cond_latent, speaker_embedding)
+        processing_time = time.time() - start_time
+        print(f"🔥 Warmup {i + 1}/{runs}: {processing_time:.1f}s")
+    
+    audio_duration = len(outputs["wav"]) / tts.synthesizer.output_sample_rate
+    if audio_duration > 0:
+        update_rtf(processing_time, audio_duration)
+
+
+if WARMUP_RUNS > 0:
+    try:
+        warmup_model(WARMUP_RUNS)
+        print("✅ Model warmed up\n")
+    except Exception as e:
+        print(f"⚠️ Warmup failed (first request will be slower): {e}\n")
+
+
 def get_system_info():
     """Get system information for health checks"""
     return {
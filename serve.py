@@ -0,0 +1,47 @@
+"""
+Multi-worker launcher for the voice cloning API
+
+Kept apart from api.py so the uvicorn supervisor process never imports core:
+importing it loads and warms up XTTS and the punctuation model, which only the
+workers need. Start with:
+
+    WORKERS=4 REDIS_URL=redis://localhost:6379 python serve.py
+"""
+import os
+
+import uvicorn
+
+
+def get_worker_count() -> int:
+    """Worker processes from WORKERS (or uvicorn's WEB_CONCURRENCY)
+
+    Multiple workers only share jobs through Redis. api.py imports core, so every
+    worker loads, warms up and holds its own XTTS and punctuation model (even with
+    USE_ARQ_QUEUE, and /api/clone always runs in-process): N workers cost N model
+    copies in RAM/VRAM, e.g. four copies on one GPU with WORKERS=4.
+    """
+    workers = max(1, int(os.getenv("WORKERS") or os.getenv("WEB_CONCURRENCY", "1")))
+    if workers > 1 and not os.getenv("REDIS_URL"):
+        print("⚠️ WORKERS > 1 requires REDIS_URL for a shared job store - using 1 worker")
+        workers = 1
+    return workers
+
+
+def main():
+    workers = get_worker_count()
+    print(f"👷 Workers: {workers}")
+    print("\n🚀 Starting server...\n")
+
+    uvicorn.run(
+        "api:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=workers,
+        loop="uvloop",
+        http="httptools",
+        log_level="info"
+    )
+
+
+if __name__ == "__main__":
+    main()
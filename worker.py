@@ -0,0 +1,48 @@
+"""
+ARQ worker for asynchronous voice cloning jobs
+Runs XTTS inference outside the API process. Start with:
+
+    REDIS_URL=redis://localhost:6379 arq worker.WorkerSettings
+
+The API must run with USE_ARQ_QUEUE=true and the same REDIS_URL, and both
+must share the temp_audio/ and outputs/ directories.
+"""
+from arq.connections import RedisSettings
+
+from api import (
+    process_clone_background,
+    connect_job_store,
+    close_job_store,
+    REDIS_URL
+)
+
+
+async def process_clone(ctx, job_id: str, text: str, audio_path: str, language: str):
+    """Run a queued voice cloning job"""
+    await process_clone_background(job_id, text, audio_path, language)
+
+
+async def startup(ctx):
+    """Connect the worker to the shared job store"""
+    if not REDIS_URL:
+        # Without it job updates would go to this process's memory, never reaching the API
+        raise RuntimeError("The ARQ worker requires REDIS_URL to be set")
+    await connect_job_store()
+
+
+async def shutdown(ctx):
+    """Close the job store connection"""
+    await close_job_store()
+
+
+class WorkerSettings:
+    """ARQ worker configuration"""
+    functions = [process_clone]
+    on_startup = startup
+    on_shutdown = shutdown
+    redis_settings = RedisSettings.from_dsn(REDIS_URL or "redis://localhost:6379")
+    max_jobs = 1  # One XTTS inference at a time per worker process
+    # Long texts on CPU can take several minutes. A timed-out job is marked failed
+    # right away, but XTTS cannot be interrupted mid-generation: the job keeps its
+    # slot until the inference thread returns, and its result is discarded
+    job_timeout = 600